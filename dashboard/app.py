@@ -20,8 +20,9 @@ import pandas as pd
 from datetime import datetime
 import dash_bootstrap_components as dbc
 from analytics.wait_time_analyzer import WaitTimeAnalyzer
-from config.database import db_manager
+from database.connection import db_manager
 from config.settings import APP_CONFIG
+from utils.cache import ttl_cached
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,28 @@ app.title = "Healthcare Wait Times Analytics"
 # Initialize analytics
 analyzer = WaitTimeAnalyzer(db_manager)
 
+# Latest completed ETL load or materialized view refresh (both write an audit row).
+# The ETL runs in another process, so cached results are keyed on this token
+# rather than invalidated by the loader.
+DATA_VERSION_QUERY = "SELECT MAX(load_timestamp) FROM audit_data_loads WHERE load_status = 'completed'"
+
+# The token itself is reused briefly so a render's queries share one lookup
+DATA_VERSION_TTL = 5
+
+@ttl_cached(ttl=DATA_VERSION_TTL, maxsize=1)
+def _data_version():
+    """Fetch the current data-version token"""
+    return db_manager.execute_query(DATA_VERSION_QUERY)[0][0]
+
+@ttl_cached(ttl=APP_CONFIG['dashboard_cache_ttl'])
+def _cached_query(query, params, data_version):
+    """Run a read-only query; data_version only takes part in the cache key"""
+    return db_manager.execute_query(query, params, as_dict=True)
+
+def cached_query(query, params=None):
+    """Run a read-only query, reusing results until the data changes or the TTL expires"""
+    return _cached_query(query, params, _data_version())
+
 # Define color scheme
 COLORS = {
     'primary': '#2C3E50',
@@ -69,7 +92,7 @@ def create_summary_cards():
     """Create summary statistics cards"""
     try:
         query = "SELECT * FROM mv_dashboard_summary"
-        summary_data = db_manager.execute_query(query)
+        summary_data = cached_query(query)
         
         if not summary_data:
             return html.Div("No summary data available", className="alert alert-warning")
@@ -98,17 +121,17 @@ def get_filter_options():
     try:
         # Get provinces
         provinces_query = "SELECT DISTINCT province_name FROM dim_provinces WHERE province_name != 'Canada' ORDER BY province_name"
-        provinces_data = db_manager.execute_query(provinces_query)
+        provinces_data = cached_query(provinces_query)
         provinces = [{'label': row['province_name'], 'value': row['province_name']} for row in provinces_data]
         
         # Get procedures
         procedures_query = "SELECT DISTINCT procedure_name FROM dim_procedures ORDER BY procedure_name"
-        procedures_data = db_manager.execute_query(procedures_query)
+        procedures_data = cached_query(procedures_query)
         procedures = [{'label': row['procedure_name'], 'value': row['procedure_name']} for row in procedures_data]
         
         # Get years
         years_query = "SELECT DISTINCT data_year FROM fact_wait_times WHERE data_year IS NOT NULL ORDER BY data_year DESC"
-        years_data = db_manager.execute_query(years_query)
+        years_data = cached_query(years_query)
         years = [{'label': str(row['data_year']), 'value': row['data_year']} for row in years_data]
         
         return provinces, procedures, years
@@ -0,0 +1,16 @@
+-- Covering index for the hot dashboard/analytical query predicates
+-- (see src/database/queries.py ANALYTICAL_QUERIES and DASHBOARD_QUERIES)
+
+-- Replaces idx_wait_times_with_data (same partial predicate and key columns)
+-- rather than adding a second overlapping index that every load must maintain;
+-- metric_id and indicator_result are INCLUDEd so queries selecting only those
+-- columns can be answered from the index
+DROP INDEX IF EXISTS idx_wait_times_with_data;
+
+CREATE INDEX IF NOT EXISTS idx_wait_times_with_data_covering
+ON fact_wait_times (province_id, procedure_id, data_year)
+INCLUDE (metric_id, indicator_result)
+WHERE indicator_result IS NOT NULL;
+
+-- Refresh planner statistics so the new index is considered
+ANALYZE fact_wait_times;
@@ -24,6 +24,10 @@ def main():
                        help='Path to source Excel file')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
+    parser.add_argument('--staged', action='store_true',
+                       help='Resolve dimension IDs in SQL via a staging table')
+    parser.add_argument('--prepare-statements', action='store_true',
+                       help='PREPARE the lookup query on connect (for repeated runs in one worker)')
     
     args = parser.parse_args()
     
@@ -45,7 +49,8 @@ def main():
     try:
         # Run ETL pipeline
         start_time = datetime.now()
-        stats = run_etl(args.file, DATABASE_CONFIG)
+        stats = run_etl(args.file, DATABASE_CONFIG, staged_load=args.staged,
+                        persistent=args.prepare_statements)
         end_time = datetime.now()
         
         # Log results
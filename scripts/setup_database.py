@@ -75,6 +75,7 @@ def main():
         sql_files = [
             'database/schema/01_create_tables.sql',
             'database/schema/02_reference_data.sql', 
+            'database/schema/03_performance_indexes.sql',
             'database/stored_procedures/sp_wait_time_trends.sql',
             'database/views/analytical_views.sql'
         ]
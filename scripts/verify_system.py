@@ -16,7 +16,7 @@ def test_imports():
     
     try:
         from config.settings import DATABASE_CONFIG, APP_CONFIG, DATA_CONFIG
-        from config.database import db_manager
+        from database.connection import db_manager
         from utils.logging_config import setup_logging
         from utils.helpers import format_number, calculate_percentage_change
         from analytics.wait_time_analyzer import WaitTimeAnalyzer
@@ -31,10 +31,10 @@ def test_database_connection():
     print("Testing database connection...")
     
     try:
-        from config.database import db_manager
+        from database.connection import db_manager
         
         # Try to execute a simple query
-        result = db_manager.execute_query("SELECT 1 as test")
+        result = db_manager.execute_query("SELECT 1 as test", as_dict=True)
         if result and result[0]['test'] == 1:
             print("✓ Database connection successful")
             return True
@@ -50,18 +50,18 @@ def test_reference_data():
     print("Testing reference data...")
     
     try:
-        from config.database import db_manager
+        from database.connection import db_manager
         
         # Check provinces
-        provinces = db_manager.execute_query("SELECT COUNT(*) as count FROM dim_provinces")
+        provinces = db_manager.execute_query("SELECT COUNT(*) as count FROM dim_provinces", as_dict=True)
         province_count = provinces[0]['count'] if provinces else 0
         
         # Check procedures
-        procedures = db_manager.execute_query("SELECT COUNT(*) as count FROM dim_procedures")
+        procedures = db_manager.execute_query("SELECT COUNT(*) as count FROM dim_procedures", as_dict=True)
         procedure_count = procedures[0]['count'] if procedures else 0
         
         # Check metrics
-        metrics = db_manager.execute_query("SELECT COUNT(*) as count FROM dim_metrics")
+        metrics = db_manager.execute_query("SELECT COUNT(*) as count FROM dim_metrics", as_dict=True)
         metric_count = metrics[0]['count'] if metrics else 0
         
         if province_count > 0 and procedure_count > 0 and metric_count > 0:
@@ -80,7 +80,7 @@ def test_analytics():
     print("Testing analytics...")
     
     try:
-        from config.database import db_manager
+        from database.connection import db_manager
         from analytics.wait_time_analyzer import WaitTimeAnalyzer
         
         analyzer = WaitTimeAnalyzer(db_manager)
@@ -108,7 +108,7 @@ def test_stored_procedures():
     print("Testing stored procedures...")
     
     try:
-        from config.database import db_manager
+        from database.connection import db_manager
         
         # Test trend analysis procedure
         result = db_manager.execute_query("SELECT * FROM sp_wait_time_trends() LIMIT 5")
@@ -98,6 +98,7 @@ class DatabaseSetup:
         sql_files = [
             'database/schema/01_create_tables.sql',
             'database/schema/02_reference_data.sql',
+            'database/schema/03_performance_indexes.sql',
             'database/stored_procedures/sp_wait_time_trends.sql',
             'database/stored_procedures/sp_provincial_comparison.sql',
             'database/stored_procedures/sp_benchmark_analysis.sql',
@@ -178,6 +179,7 @@ LOG_LEVEL=INFO
 # Dashboard Configuration
 DASHBOARD_HOST=0.0.0.0
 DASHBOARD_PORT=8050
+DASHBOARD_CACHE_TTL=300
 """
     
     if not os.path.exists('.env'):
@@ -4,12 +4,9 @@ Contains application settings and database configuration
 """
 
 from .settings import DATABASE_CONFIG, APP_CONFIG, DATA_CONFIG
-from .database import DatabaseManager, db_manager
 
 __all__ = [
     'DATABASE_CONFIG',
     'APP_CONFIG', 
-    'DATA_CONFIG',
-    'DatabaseManager',
-    'db_manager'
+    'DATA_CONFIG'
 ]
\ No newline at end of file
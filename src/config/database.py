@@ -1,70 +0,0 @@
-"""
-Database Configuration and Connection Management
-"""
-
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from contextlib import contextmanager
-import logging
-from typing import Dict, List, Optional, Any
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-logger = logging.getLogger(__name__)
-
-class DatabaseManager:
-    """Database connection manager with connection pooling"""
-    
-    def __init__(self, config=None):
-        self.config = config or {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'port': int(os.getenv('DB_PORT', 5432)),
-            'database': os.getenv('DB_NAME', 'healthcare_analytics'),
-            'user': os.getenv('DB_USER', 'postgres'),
-            'password': os.getenv('DB_PASSWORD', ''),
-        }
-        self._connection = None
-    
-    def get_connection(self):
-        """Get database connection"""
-        if self._connection is None or self._connection.closed:
-            self._connection = psycopg2.connect(**self.config)
-        return self._connection
-    
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
-        """Execute a query and return results as list of dicts"""
-        try:
-            with self.get_cursor() as cursor:
-                cursor.execute(query, params)
-                if cursor.description:
-                    return cursor.fetchall()
-                return []
-        except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            raise
-    
-    @contextmanager
-    def get_cursor(self, dict_cursor=True):
-        """Context manager for database cursor"""
-        conn = self.get_connection()
-        cursor_factory = RealDictCursor if dict_cursor else None
-        
-        try:
-            with conn.cursor(cursor_factory=cursor_factory) as cursor:
-                yield cursor
-                conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-    
-    def close(self):
-        """Close database connection"""
-        if self._connection and not self._connection.closed:
-            self._connection.close()
-            logger.info("Database connection closed")
-
-# Global database manager instance
-db_manager = DatabaseManager()
\ No newline at end of file
@@ -3,6 +3,7 @@ Application Configuration Settings
 """
 
 import os
+import queue
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -29,6 +30,7 @@ APP_CONFIG = {
     'log_level': os.getenv('LOG_LEVEL', 'INFO'),
     'dashboard_host': os.getenv('DASHBOARD_HOST', '0.0.0.0'),
     'dashboard_port': int(os.getenv('DASHBOARD_PORT', 8050)),
+    'dashboard_cache_ttl': int(os.getenv('DASHBOARD_CACHE_TTL', 300)),
 }
 
 # Data configuration
@@ -40,6 +42,17 @@ DATA_CONFIG = {
     'sheet_name': 'Wait times 2008 to 2023',
 }
 
+# Log records are queued by the handler and written to disk by a
+# background listener (see utils.logging_config.setup_logging)
+LOG_QUEUE = queue.Queue(-1)
+
+LOG_FILE_CONFIG = {
+    'filename': str(LOGS_DIR / 'application.log'),
+    'level': 'INFO',
+    'max_bytes': 50 * 1024 * 1024,
+    'backup_count': 5,
+}
+
 # Logging configuration
 LOGGING_CONFIG = {
     'version': 1,
@@ -56,11 +69,9 @@ LOGGING_CONFIG = {
             'class': 'logging.StreamHandler',
         },
         'file': {
-            'level': 'INFO',
-            'formatter': 'standard',
-            'class': 'logging.FileHandler',
-            'filename': str(LOGS_DIR / 'application.log'),
-            'mode': 'a',
+            'level': LOG_FILE_CONFIG['level'],
+            'class': 'logging.handlers.QueueHandler',
+            'queue': LOG_QUEUE,
         },
     },
     'loggers': {
@@ -3,12 +3,14 @@ Database Module
 Provides database connectivity and data models
 """
 
-from .connection import DatabaseConnection, get_db_connection
+from .connection import DatabaseClient, DatabaseConnection, db_manager, get_db_connection
 from .models import Province, Procedure, Metric, WaitTime
 from .queries import PROVINCE_QUERIES, PROCEDURE_QUERIES, ANALYTICAL_QUERIES
 
 __all__ = [
+    'DatabaseClient',
     'DatabaseConnection',
+    'db_manager',
     'get_db_connection',
     'Province',
     'Procedure', 
@@ -3,55 +3,234 @@ Database Connection Management
 """
 
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extras import RealDictCursor, execute_batch
+from contextlib import contextmanager
+import io
+import threading
 import logging
 from typing import Dict, List, Optional, Tuple, Any
 import os
+from dotenv import load_dotenv
+from .queries import PREPARED_QUERIES
+
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-class DatabaseConnection:
-    """Manages database connections and operations"""
+def get_default_connection_params() -> Dict[str, Any]:
+    """Connection parameters from environment variables"""
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', 5432)),
+        'database': os.getenv('DB_NAME', 'healthcare_analytics'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('DB_PASSWORD', ''),
+    }
+
+class DatabaseClient:
+    """Pool-backed database client shared by ETL, analytics and dashboard"""
     
-    def __init__(self, connection_params: Dict[str, str]):
-        self.connection_params = connection_params
+    def __init__(self, connection_params: Optional[Dict[str, Any]] = None,
+                 min_connections: int = 1, max_connections: int = 10,
+                 autocommit: bool = False, persistent: bool = False):
+        self.connection_params = connection_params or get_default_connection_params()
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.autocommit = autocommit
+        # Long-lived workers PREPARE hot ETL queries once on the pinned
+        # connection; one-shot CLI runs skip it since the planning would not be amortized
+        self.persistent = persistent
+        self.pool = None
+        # After connect() the client is pinned to one pooled connection so an
+        # ETL load runs as a single transaction; unpinned clients (dashboard)
+        # check out a connection per cursor, so concurrent callbacks don't share one
         self.connection = None
+        self._lock = threading.Lock()
+        # ThreadedConnectionPool raises PoolError when exhausted instead of
+        # waiting, so checkouts queue on this semaphore first
+        self._slots = threading.BoundedSemaphore(max_connections)
         
-    def connect(self):
-        """Establish database connection"""
+    def initialize_pool(self):
+        """Open the connection pool if it is not already open"""
+        with self._lock:
+            self._initialize_pool()
+            
+    def _initialize_pool(self):
+        """Open the pool; caller holds the lock"""
+        if self.pool is not None and not self.pool.closed:
+            return
         try:
-            self.connection = psycopg2.connect(**self.connection_params)
-            self.connection.autocommit = False
-            logger.info("Database connection established")
+            self.pool = ThreadedConnectionPool(
+                self.min_connections, self.max_connections, **self.connection_params
+            )
+            logger.info("Database connection pool initialized")
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
             raise
             
+    def _checkout(self):
+        """Take a connection from the pool, waiting while all are checked out"""
+        with self._lock:
+            self._initialize_pool()
+            pool = self.pool
+        self._slots.acquire()
+        try:
+            conn = pool.getconn()
+            conn.autocommit = self.autocommit
+        except Exception:
+            self._slots.release()
+            raise
+        return pool, conn
+        
+    def _checkin(self, pool, conn, close: bool = False):
+        """Return a connection to the pool and free its slot"""
+        try:
+            pool.putconn(conn, close=close)
+        finally:
+            self._slots.release()
+            
+    def connect(self):
+        """Pin a pooled connection to this client for transactional work"""
+        with self._lock:
+            self._initialize_pool()
+            
+            if self.connection is not None and self.connection.closed:
+                self._checkin(self.pool, self.connection, close=True)
+                self.connection = None
+                
+            if self.connection is None:
+                self._slots.acquire()
+                try:
+                    self.connection = self.pool.getconn()
+                except Exception:
+                    self._slots.release()
+                    raise
+                self.connection.autocommit = self.autocommit
+                logger.info("Database connection established")
+                
+                if self.persistent:
+                    self._prepare_statements()
+                    
+            return self.connection
+        
+    def _prepare_statements(self):
+        """PREPARE the named ETL queries on the pinned connection"""
+        with self.connection.cursor() as cursor:
+            for name, query in PREPARED_QUERIES.items():
+                cursor.execute(f"PREPARE {name} AS {query}")
+        if not self.autocommit:
+            self.connection.commit()
+            
+    def prepared_query(self, name: str) -> str:
+        """SQL to run a named query, via EXECUTE when it has been PREPAREd"""
+        if self.persistent and self.connection is not None:
+            return f"EXECUTE {name}"
+        return PREPARED_QUERIES[name]
+        
+    def get_connection(self):
+        """Get the client's pinned connection, connecting on first use"""
+        return self.connect()
+        
     def disconnect(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            logger.info("Database connection closed")
-            
-    def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
-        """Execute a single query"""
-        with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+        """Return the pinned connection and close the pool"""
+        with self._lock:
+            if self.pool is None:
+                return
+            if self.connection is not None:
+                self._checkin(self.pool, self.connection)
+                self.connection = None
+            self.pool.closeall()
+            self.pool = None
+        logger.info("Database connection closed")
+        
+    @contextmanager
+    def _connection_scope(self):
+        """The pinned connection, or a pooled one held for the duration of the block"""
+        if self.connection is not None and not self.connection.closed:
+            # Pinned: the caller owns the transaction
+            yield self.connection
+            return
+        
+        pool, conn = self._checkout()
+        try:
+            yield conn
+            if not conn.autocommit:
+                conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self._checkin(pool, conn, close=bool(conn.closed))
+        
+    @contextmanager
+    def cursor(self, *args, **kwargs):
+        """Cursor on the pinned connection, or on a pooled connection for this call"""
+        with self._connection_scope() as conn:
+            with conn.cursor(*args, **kwargs) as cursor:
+                yield cursor
+        
+    @contextmanager
+    def get_cursor(self, dict_cursor=True):
+        """Context manager for a cursor that commits on success"""
+        cursor_factory = RealDictCursor if dict_cursor else None
+        
+        with self._connection_scope() as conn:
+            try:
+                with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                    yield cursor
+                    conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            
+    def execute_query(self, query: str, params: Optional[Tuple] = None,
+                      as_dict: bool = False) -> List[Any]:
+        """Execute a single query, returning tuples (or dicts with as_dict=True)"""
+        cursor_factory = RealDictCursor if as_dict else None
+        with self.cursor(cursor_factory=cursor_factory) as cursor:
             cursor.execute(query, params)
             if cursor.description:
                 return cursor.fetchall()
             return []
             
     def execute_batch(self, query: str, data: List[Tuple]):
-        """Execute batch insert/update operations"""
-        with self.connection.cursor() as cursor:
+        """Execute batch update/delete operations"""
+        with self.cursor() as cursor:
             execute_batch(cursor, query, data, page_size=1000)
+            
+    def copy_rows(self, table: str, columns: List[str], data: List[Tuple]):
+        """Bulk load rows with COPY FROM STDIN (CSV)"""
+        buffer = io.StringIO()
+        buffer.writelines(','.join(map(_csv_field, row)) + '\n' for row in data)
+        buffer.seek(0)
+        
+        copy_query = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)"
+        with self.cursor() as cursor:
+            cursor.copy_expert(copy_query, buffer)
+
+def _csv_field(value) -> str:
+    """One COPY CSV field: NULL unquoted-empty, booleans t/f, text always quoted"""
+    # Quoting every string keeps '' distinct from NULL (only an unquoted
+    # empty field is NULL in CSV mode)
+    if value is None:
+        return ''
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+# Backwards-compatible name used by the ETL pipeline
+DatabaseConnection = DatabaseClient
+
+# Shared client for the dashboard and scripts (read-only, autocommit)
+db_manager = DatabaseClient(autocommit=True)
 
 def get_db_connection():
-    """Factory function for database connections"""
-    return psycopg2.connect(
-        host=os.getenv('DB_HOST', 'localhost'),
-        database=os.getenv('DB_NAME', 'healthcare_analytics'),
-        user=os.getenv('DB_USER', 'postgres'),
-        password=os.getenv('DB_PASSWORD', 'your_password'),
-        port=os.getenv('DB_PORT', 5432)
-    )
\ No newline at end of file
+    """Factory function for standalone (unpooled) database connections"""
+    return psycopg2.connect(**get_default_connection_params())
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Province:
     province_id: int
     province_code: str
@@ -16,7 +16,7 @@ class Province:
     population_estimate: Optional[int] = None
     created_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True)
 class Procedure:
     procedure_id: int
     procedure_code: str
@@ -26,7 +26,7 @@ class Procedure:
     is_surgery: bool = False
     created_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     metric_id: int
     metric_code: str
@@ -36,7 +36,7 @@ class Metric:
     description: Optional[str] = None
     created_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True)
 class WaitTime:
     wait_time_id: str
     province_id: int
@@ -50,4 +50,3 @@ class WaitTime:
     region_name: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-
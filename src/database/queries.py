@@ -1,5 +1,9 @@
 """
 Database Query Templates and Constants
+
+The analytical and dashboard filters on non-null results use the partial
+covering index in database/schema/03_performance_indexes.sql; queries that
+select only its key and INCLUDEd columns can be answered index-only.
 """
 
 # Basic dimension queries
@@ -20,6 +24,20 @@ METRIC_QUERIES = {
     'get_by_type': "SELECT * FROM dim_metrics WHERE metric_type = %s ORDER BY metric_name"
 }
 
+# ETL queries PREPAREd once per connection by persistent DatabaseClient instances
+PREPARED_QUERIES = {
+    # All four dimension tables in a single round trip, tagged by mapping key
+    'lookup_mappings': """
+        SELECT 'provinces' AS dimension, province_id AS id, province_name AS name FROM dim_provinces
+        UNION ALL
+        SELECT 'procedures', procedure_id, procedure_name FROM dim_procedures
+        UNION ALL
+        SELECT 'metrics', metric_id, metric_name FROM dim_metrics
+        UNION ALL
+        SELECT 'levels', level_id, level_name FROM dim_reporting_levels
+    """
+}
+
 # Analytical queries
 ANALYTICAL_QUERIES = {
     'wait_times_summary': """
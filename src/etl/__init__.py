@@ -3,17 +3,19 @@ ETL Module
 Extract, Transform, Load pipeline for healthcare wait time data
 """
 
-from .extract import extract_data, validate_extracted_data
+from .extract import extract_data, extract_data_multi, validate_extracted_data
 from .transform import transform_data, validate_transformed_data
-from .load import load_data, get_lookup_mappings
+from .load import load_data, load_data_staged, get_lookup_mappings
 from .pipeline import WaitTimeETL, run_etl
 
 __all__ = [
     'extract_data',
+    'extract_data_multi',
     'validate_extracted_data',
     'transform_data', 
     'validate_transformed_data',
     'load_data',
+    'load_data_staged',
     'get_lookup_mappings',
     'WaitTimeETL',
     'run_etl'
@@ -4,33 +4,90 @@ Description: Data extraction utilities split from ETL pipeline
 """
 
 import pandas as pd
+import openpyxl
+import hashlib
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
+from ..utils.helpers import read_sheet
 
 logger = logging.getLogger(__name__)
 
+# Releases split into one sheet per year, e.g. 'Wait times 2023'
+YEARLY_SHEET_PATTERN = re.compile(r'Wait times \d+$')
+
+def _read_one_sheet(args: Tuple[str, str]) -> pd.DataFrame:
+    """Worker for extract_data_multi: read one sheet with stripped column names"""
+    file_path, sheet_name = args
+    df = read_sheet(file_path, sheet_name=sheet_name)
+    df.columns = df.columns.str.strip()
+    return df
+
+def find_yearly_sheets(file_path: str) -> List[str]:
+    """Names of per-year wait time sheets in the workbook"""
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        return [name for name in workbook.sheetnames if YEARLY_SHEET_PATTERN.match(name)]
+    finally:
+        workbook.close()
+
+def extract_data_multi(file_path: str, sheet_names: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read several sheets in parallel worker processes and stack them"""
+    if sheet_names is None:
+        sheet_names = find_yearly_sheets(file_path)
+    if not sheet_names:
+        raise ValueError(f"No yearly wait time sheets found in {file_path}")
+    
+    # openpyxl parsing is pure Python and GIL-bound, so fan out across processes
+    max_workers = min(len(sheet_names), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        dfs = list(executor.map(_read_one_sheet, [(file_path, name) for name in sheet_names]))
+    
+    logger.info(f"Read {len(sheet_names)} sheets from {file_path}")
+    return pd.concat(dfs, ignore_index=True)
+
+def _extract_cache_path(file_path: str) -> Path:
+    """Parquet cache location keyed on the source file's content hash"""
+    key = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()[:16]
+    return Path(os.getenv('ETL_CACHE_DIR', '.cache')) / f'{key}.parquet'
+
 def extract_data(file_path: str) -> pd.DataFrame:
     """Extract data from Excel file"""
     logger.info(f"Extracting data from {file_path}")
     
     try:
-        # Read the specific worksheet with wait time data
-        df = pd.read_excel(
-            file_path, 
-            sheet_name='Wait times 2008 to 2023',
-            skiprows=2,  # Skip header rows
-            engine='openpyxl'
-        )
+        # Reuse a previous parse of the same workbook when ETL_CACHE=1
+        cache_path = _extract_cache_path(file_path) if os.getenv('ETL_CACHE') == '1' else None
+        if cache_path is not None and cache_path.exists():
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            logger.info(f"Loaded {len(df)} records from extract cache {cache_path}")
+            return df
+        
+        # Read the wait time worksheet, or every per-year sheet in split releases
+        yearly_sheets = find_yearly_sheets(file_path)
+        if len(yearly_sheets) > 1:
+            df = extract_data_multi(file_path, yearly_sheets)
+        else:
+            df = read_sheet(file_path)
         
         # Clean column names
         df.columns = df.columns.str.strip()
         
-        # Remove empty rows
-        df = df.dropna(how='all')
-        
-        # Filter out rows where all key columns are empty
+        # Filter out rows where all key columns are empty (this also drops fully
+        # empty rows) in one numpy reduction over the key columns
         key_columns = ['Province/territory', 'Indicator', 'Metric', 'Data year']
-        df = df.dropna(subset=key_columns, how='all')
+        mask = df[key_columns].notna().to_numpy().any(axis=1)
+        df = df.loc[mask]
+        
+        # Shrink dtypes before handing off to transform
+        df = downcast_columns(df)
+        
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
         
         logger.info(f"Extracted {len(df)} records from source file")
         return df
@@ -39,6 +96,17 @@ def extract_data(file_path: str) -> pd.DataFrame:
         logger.error(f"Data extraction failed: {e}")
         raise
 
+def downcast_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast integer columns to their smallest dtype"""
+    # int64 -> smallest integer dtype that holds the values (year fits int16).
+    # Floats stay float64: float32 can shift results across the DECIMAL(10,2)
+    # rounding boundary (e.g. 271.945 -> 271.95 instead of 271.94).
+    # Text is categorized in transform_data, after it has been stripped
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    return df
+
 def validate_extracted_data(df: pd.DataFrame) -> bool:
     """Validate extracted data structure"""
     required_columns = [
@@ -47,7 +115,9 @@ def validate_extracted_data(df: pd.DataFrame) -> bool:
         'Unit of measurement', 'Indicator result'
     ]
     
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    # Hash lookups against a frozenset, reported in required_columns order
+    columns = frozenset(df.columns)
+    missing_columns = [col for col in required_columns if col not in columns]
     
     if missing_columns:
         logger.error(f"Missing required columns: {missing_columns}")
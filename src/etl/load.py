@@ -4,81 +4,104 @@ Description: Data loading utilities split from ETL pipeline
 """
 
 import pandas as pd
+import numpy as np
 import logging
+import os
 from typing import Dict, List, Tuple
 from datetime import datetime
+from ..utils.cache import ttl_cached
 
 logger = logging.getLogger(__name__)
 
+# fact_wait_times columns in prepare_fact_data tuple order
+FACT_COLUMNS = [
+    'province_id', 'procedure_id', 'metric_id', 'reporting_level_id',
+    'data_year', 'indicator_result', 'is_estimate', 'data_quality_flag', 'region_name'
+]
+
+# Dimension tables rarely change; seconds to reuse mappings fetched through a client
+LOOKUP_CACHE_TTL = float(os.getenv('LOOKUP_CACHE_TTL', 300))
+
+@ttl_cached(ttl=LOOKUP_CACHE_TTL, maxsize=8)
 def get_lookup_mappings(db_connection) -> Dict[str, Dict]:
-    """Get ID mappings for dimension tables"""
+    """Get ID mappings for dimension tables (cached per client, see cache_clear)"""
     logger.info("Loading lookup table mappings")
     
-    mappings = {}
-    
-    # Province mappings
-    province_query = "SELECT province_id, province_name FROM dim_provinces"
-    province_results = db_connection.execute_query(province_query)
-    mappings['provinces'] = {row['province_name']: row['province_id'] for row in province_results}
-    
-    # Procedure mappings
-    procedure_query = "SELECT procedure_id, procedure_name FROM dim_procedures"
-    procedure_results = db_connection.execute_query(procedure_query)
-    mappings['procedures'] = {row['procedure_name']: row['procedure_id'] for row in procedure_results}
+    mappings = {'provinces': {}, 'procedures': {}, 'metrics': {}, 'levels': {}}
     
-    # Metric mappings
-    metric_query = "SELECT metric_id, metric_name FROM dim_metrics"
-    metric_results = db_connection.execute_query(metric_query)
-    mappings['metrics'] = {row['metric_name']: row['metric_id'] for row in metric_results}
-    
-    # Reporting level mappings
-    level_query = "SELECT level_id, level_name FROM dim_reporting_levels"
-    level_results = db_connection.execute_query(level_query)
-    mappings['levels'] = {row['level_name']: row['level_id'] for row in level_results}
+    query = db_connection.prepared_query('lookup_mappings')
+    for dimension, dim_id, name in db_connection.execute_query(query):
+        mappings[dimension][name] = dim_id
     
     return mappings
 
+def _to_nullable_list(series: pd.Series, dtype) -> list:
+    """Extract a column once as a NumPy array; native Python values, None for missing"""
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    missing = np.isnan(values)
+    result = np.where(missing, 0, values).astype(dtype).astype(object)
+    result[missing] = None
+    return result.tolist()
+
+def _map_dimension_ids(series: pd.Series, mapping: Dict) -> np.ndarray:
+    """Dimension IDs as float64, NaN where the name has no mapping"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # One dict lookup per category, then a gather over the integer codes;
+        # the trailing NaN is picked up by code -1 (missing value)
+        code_to_id = np.array(
+            [mapping.get(name, np.nan) for name in series.cat.categories] + [np.nan],
+            dtype=np.float64
+        )
+        return code_to_id[series.cat.codes.to_numpy()]
+    return series.map(mapping).to_numpy(dtype=np.float64, na_value=np.nan)
+
 def prepare_fact_data(df: pd.DataFrame, mappings: Dict[str, Dict]) -> Tuple[List[Tuple], List[str]]:
     """Prepare data for loading into fact table"""
     logger.info("Preparing fact table data")
     
-    insert_data = []
-    failed_records = []
-    
-    for idx, row in df.iterrows():
-        try:
-            # Map dimension IDs
-            province_id = mappings['provinces'].get(row['province_name'])
-            procedure_id = mappings['procedures'].get(row['procedure_name'])
-            metric_id = mappings['metrics'].get(row['metric_name'])
-            level_id = mappings['levels'].get(row['reporting_level'])
-            
-            # Skip records with missing dimension mappings
-            if not all([province_id, procedure_id, metric_id, level_id]):
-                failed_records.append(f"Row {idx}: Missing dimension mapping")
-                continue
-            
-            # Prepare insert tuple
-            insert_tuple = (
-                province_id,
-                procedure_id,
-                metric_id,
-                level_id,
-                int(row['data_year']) if pd.notna(row['data_year']) else None,
-                float(row['indicator_result']) if pd.notna(row['indicator_result']) else None,
-                False,  # is_estimate
-                row['data_quality_flag'],
-                row.get('region_name', 'n/a')
-            )
-            
-            insert_data.append(insert_tuple)
-            
-        except Exception as e:
-            failed_records.append(f"Row {idx}: {str(e)}")
-            continue
-    
-    logger.info(f"Prepared {len(insert_data)} records for loading")
-    return insert_data, failed_records
+    try:
+        # Map dimension IDs into one contiguous (rows x 4) float matrix, NaN where unmapped
+        dimension_columns = [
+            ('province_name', 'provinces'),
+            ('procedure_name', 'procedures'),
+            ('metric_name', 'metrics'),
+            ('reporting_level', 'levels')
+        ]
+        ids = np.column_stack([
+            _map_dimension_ids(df[col], mappings[dim])
+            for col, dim in dimension_columns
+        ])
+        
+        # Skip records with missing dimension mappings; this is the only expected
+        # per-row failure, so it is a mask rather than per-row exception handling
+        valid = ~np.isnan(ids).any(axis=1)
+        failed_records = [f"Row {idx}: Missing dimension mapping" for idx in df.index[~valid]]
+        
+        sub = df.loc[valid]
+        sub_ids = ids[valid].astype(np.int64)
+        
+        if 'region_name' in sub.columns:
+            # Build a new array rather than writing into a (read-only) CoW view
+            regions = sub['region_name'].to_numpy(dtype=object)
+            regions = np.where(pd.isna(regions), 'n/a', regions).tolist()
+        else:
+            regions = ['n/a'] * len(sub)
+        
+        insert_data = list(zip(
+            *sub_ids.T.tolist(),  # province, procedure, metric, level IDs
+            _to_nullable_list(sub['data_year'], np.int64),
+            _to_nullable_list(sub['indicator_result'], np.float64),
+            [False] * len(sub),  # is_estimate
+            sub['data_quality_flag'].tolist(),
+            regions
+        ))
+        
+        logger.info(f"Prepared {len(insert_data)} records for loading")
+        return insert_data, failed_records
+        
+    except Exception as e:
+        logger.error(f"Fact data preparation failed: {e}")
+        raise
 
 def load_data(db_connection, insert_data: List[Tuple], load_id: str) -> Dict[str, int]:
     """Load transformed data into database"""
@@ -90,32 +113,130 @@ def load_data(db_connection, insert_data: List[Tuple], load_id: str) -> Dict[str
     }
     
     try:
-        # Start audit record
+        # Audit rows and fact rows share one transaction, committed once at the end
         start_load_audit(db_connection, load_id, len(insert_data))
         
         if insert_data:
-            insert_query = """
-            INSERT INTO fact_wait_times 
-            (province_id, procedure_id, metric_id, reporting_level_id, 
-             data_year, indicator_result, is_estimate, data_quality_flag, region_name)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
+            db_connection.copy_rows('fact_wait_times', FACT_COLUMNS, insert_data)
             
-            db_connection.execute_batch(insert_query, insert_data)
-            db_connection.connection.commit()
+            # Refresh planner statistics for the new rows
+            db_connection.execute_query("ANALYZE fact_wait_times")
             
             stats['records_inserted'] = len(insert_data)
-            logger.info(f"Successfully inserted {len(insert_data)} records")
         
-        # Complete audit record
         complete_load_audit(db_connection, load_id, stats['records_inserted'], stats['records_failed'], 'completed')
+        db_connection.connection.commit()
         
+        logger.info(f"Successfully inserted {stats['records_inserted']} records")
         return stats
         
     except Exception as e:
-        db_connection.connection.rollback()
-        complete_load_audit(db_connection, load_id, 0, len(insert_data), 'failed', str(e))
         logger.error(f"Data load failed: {e}")
+        record_failed_load(db_connection, load_id, len(insert_data), str(e))
+        raise
+
+# Staging table for set-based dimension lookups; dropped when the load commits
+STAGE_TABLE_QUERY = """
+CREATE TEMP TABLE stage_wait_times (
+    row_num BIGINT,
+    province_name VARCHAR(100),
+    procedure_name VARCHAR(100),
+    metric_name VARCHAR(100),
+    reporting_level VARCHAR(50),
+    data_year INTEGER,
+    indicator_result DECIMAL(10,2),
+    data_quality_flag VARCHAR(10),
+    region_name VARCHAR(100)
+) ON COMMIT DROP
+"""
+
+STAGE_COLUMNS = [
+    'row_num', 'province_name', 'procedure_name', 'metric_name', 'reporting_level',
+    'data_year', 'indicator_result', 'data_quality_flag', 'region_name'
+]
+
+STAGED_INSERT_QUERY = """
+INSERT INTO fact_wait_times 
+(province_id, procedure_id, metric_id, reporting_level_id, 
+ data_year, indicator_result, is_estimate, data_quality_flag, region_name)
+SELECT p.province_id, pr.procedure_id, m.metric_id, l.level_id,
+       s.data_year, s.indicator_result, FALSE, s.data_quality_flag, COALESCE(s.region_name, 'n/a')
+FROM stage_wait_times s
+JOIN dim_provinces p ON p.province_name = s.province_name
+JOIN dim_procedures pr ON pr.procedure_name = s.procedure_name
+JOIN dim_metrics m ON m.metric_name = s.metric_name
+JOIN dim_reporting_levels l ON l.level_name = s.reporting_level
+"""
+
+STAGED_REJECTS_QUERY = """
+SELECT s.row_num
+FROM stage_wait_times s
+LEFT JOIN dim_provinces p ON p.province_name = s.province_name
+LEFT JOIN dim_procedures pr ON pr.procedure_name = s.procedure_name
+LEFT JOIN dim_metrics m ON m.metric_name = s.metric_name
+LEFT JOIN dim_reporting_levels l ON l.level_name = s.reporting_level
+WHERE p.province_id IS NULL OR pr.procedure_id IS NULL
+   OR m.metric_id IS NULL OR l.level_id IS NULL
+ORDER BY s.row_num
+"""
+
+def _to_text_list(df: pd.DataFrame, col: str) -> list:
+    """Text column as native Python values, None for missing"""
+    if col not in df.columns:
+        return [None] * len(df)
+    values = df[col].astype(object)
+    return values.where(df[col].notna(), None).tolist()
+
+def load_data_staged(db_connection, df: pd.DataFrame, load_id: str) -> Tuple[Dict[str, int], List[str]]:
+    """Load transformed data, resolving dimension IDs with a SQL join on a staging table"""
+    logger.info("Starting staged data load process")
+    
+    stats = {
+        'records_inserted': 0,
+        'records_failed': 0
+    }
+    
+    try:
+        # Audit rows and fact rows share one transaction, committed once at the end
+        start_load_audit(db_connection, load_id, len(df))
+        
+        stage_rows = list(zip(
+            df.index.tolist(),
+            _to_text_list(df, 'province_name'),
+            _to_text_list(df, 'procedure_name'),
+            _to_text_list(df, 'metric_name'),
+            _to_text_list(df, 'reporting_level'),
+            _to_nullable_list(df['data_year'], np.int64),
+            _to_nullable_list(df['indicator_result'], np.float64),
+            _to_text_list(df, 'data_quality_flag'),
+            _to_text_list(df, 'region_name')
+        ))
+        
+        with db_connection.cursor() as cursor:
+            cursor.execute(STAGE_TABLE_QUERY)
+        db_connection.copy_rows('stage_wait_times', STAGE_COLUMNS, stage_rows)
+        
+        with db_connection.cursor() as cursor:
+            # One set-based hash join instead of per-row dictionary lookups
+            cursor.execute(STAGED_INSERT_QUERY)
+            stats['records_inserted'] = cursor.rowcount
+            
+            cursor.execute(STAGED_REJECTS_QUERY)
+            failed_records = [f"Row {row_num}: Missing dimension mapping" for (row_num,) in cursor.fetchall()]
+            stats['records_failed'] = len(failed_records)
+        
+        # Refresh planner statistics for the new rows
+        db_connection.execute_query("ANALYZE fact_wait_times")
+        
+        complete_load_audit(db_connection, load_id, stats['records_inserted'], stats['records_failed'], 'completed')
+        db_connection.connection.commit()
+        
+        logger.info(f"Successfully inserted {stats['records_inserted']} records")
+        return stats, failed_records
+        
+    except Exception as e:
+        logger.error(f"Data load failed: {e}")
+        record_failed_load(db_connection, load_id, len(df), str(e))
         raise
 
 def start_load_audit(db_connection, load_id: str, record_count: int):
@@ -130,7 +251,6 @@ def start_load_audit(db_connection, load_id: str, record_count: int):
         audit_query, 
         (load_id, 'wait_times_data.xlsx', record_count, 'in_progress')
     )
-    db_connection.connection.commit()
 
 def complete_load_audit(db_connection, load_id: str, records_inserted: int, 
                        records_failed: int, status: str, error_message: str = None):
@@ -141,12 +261,38 @@ def complete_load_audit(db_connection, load_id: str, records_inserted: int,
         records_inserted = %s,
         records_failed = %s,
         error_message = %s,
-        load_duration_seconds = EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - load_timestamp))
+        load_duration_seconds = EXTRACT(EPOCH FROM (clock_timestamp() - load_timestamp))
     WHERE load_id = %s
     """
     
+    # clock_timestamp(): CURRENT_TIMESTAMP is frozen at the start of the
+    # load transaction, which also set load_timestamp
     db_connection.execute_query(
         audit_query,
         (status, records_inserted, records_failed, error_message, load_id)
     )
-    db_connection.connection.commit()
\ No newline at end of file
+
+def record_failed_load(db_connection, load_id: str, record_count: int, error_message: str):
+    """Roll back the load and record the failure in its own short transaction"""
+    audit_query = """
+    INSERT INTO audit_data_loads 
+    (load_id, source_file, records_processed, records_inserted, records_failed,
+     load_status, error_message)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """
+    
+    try:
+        connection = db_connection.connection
+        if connection is not None and not connection.closed:
+            connection.rollback()
+        
+        # The in-progress audit row was discarded with the load transaction;
+        # connect() pins a fresh connection if the old one was lost
+        db_connection.connect()
+        db_connection.execute_query(
+            audit_query,
+            (load_id, 'wait_times_data.xlsx', record_count, 0, record_count, 'failed', error_message)
+        )
+        db_connection.connection.commit()
+    except Exception as audit_error:
+        logger.error(f"Could not record failed load {load_id}: {audit_error}")
\ No newline at end of file
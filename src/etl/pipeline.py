@@ -9,7 +9,7 @@ import uuid
 from typing import Dict
 from .extract import extract_data, validate_extracted_data
 from .transform import transform_data, validate_transformed_data
-from .load import get_lookup_mappings, prepare_fact_data, load_data
+from .load import get_lookup_mappings, prepare_fact_data, load_data, load_data_staged
 from ..database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
@@ -17,8 +17,10 @@ logger = logging.getLogger(__name__)
 class WaitTimeETL:
     """Main ETL orchestrator using split modules"""
     
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(self, db_connection: DatabaseConnection, staged_load: bool = False):
         self.db = db_connection
+        # Resolve dimension IDs in SQL via a staging table instead of in Python
+        self.staged_load = staged_load
         self.load_id = str(uuid.uuid4())
         self.stats = {
             'records_processed': 0,
@@ -50,14 +52,19 @@ class WaitTimeETL:
             
             # Load phase
             logger.info("Phase 3: Load")
-            mappings = get_lookup_mappings(self.db)
-            insert_data, failed_records = prepare_fact_data(clean_data, mappings)
-            
-            self.stats['records_failed'] = len(failed_records)
-            
-            if insert_data:
-                load_stats = load_data(self.db, insert_data, self.load_id)
+            if self.staged_load:
+                load_stats, failed_records = load_data_staged(self.db, clean_data, self.load_id)
+                self.stats['records_failed'] = len(failed_records)
                 self.stats['records_inserted'] = load_stats['records_inserted']
+            else:
+                mappings = get_lookup_mappings(self.db)
+                insert_data, failed_records = prepare_fact_data(clean_data, mappings)
+                
+                self.stats['records_failed'] = len(failed_records)
+                
+                if insert_data:
+                    load_stats = load_data(self.db, insert_data, self.load_id)
+                    self.stats['records_inserted'] = load_stats['records_inserted']
             
             # Summary
             duration = (datetime.now() - start_time).total_seconds()
@@ -70,17 +77,18 @@ class WaitTimeETL:
             logger.error(f"ETL pipeline failed: {e}")
             raise
 
-def run_etl(file_path: str, db_params: Dict[str, str]) -> Dict[str, int]:
+def run_etl(file_path: str, db_params: Dict[str, str], staged_load: bool = False,
+            persistent: bool = False) -> Dict[str, int]:
     """Convenience function to run ETL pipeline"""
-    # Initialize database connection
-    db_conn = DatabaseConnection(db_params)
+    # Initialize database connection (persistent: PREPARE the lookup query on connect)
+    db_conn = DatabaseConnection(db_params, persistent=persistent)
     
     try:
         # Connect to database
         db_conn.connect()
         
         # Initialize ETL processor
-        etl_processor = WaitTimeETL(db_conn)
+        etl_processor = WaitTimeETL(db_conn, staged_load=staged_load)
         
         # Run ETL pipeline
         return etl_processor.run_etl_pipeline(file_path)
@@ -89,20 +97,4 @@ def run_etl(file_path: str, db_params: Dict[str, str]) -> Dict[str, int]:
         logger.error(f"ETL process failed: {e}")
         raise
     finally:
-        db_conn.disconnect()
-
-if __name__ == "__main__":
-    # Example usage
-    db_params = {
-        'host': 'localhost',
-        'database': 'healthcare_analytics',
-        'user': 'postgres', 
-        'password': 'your_password',
-        'port': 5432
-    }
-    
-    try:
-        stats = run_etl('data/raw/wait_times_data.xlsx', db_params)
-        print(f"ETL completed: {stats}")
-    except Exception as e:
-        print(f"ETL failed: {e}")
\ No newline at end of file
+        db_conn.disconnect()
\ No newline at end of file
@@ -11,13 +11,15 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+# Copy-on-Write (always on from pandas 3.0) makes defensive copies unnecessary:
+# columns are only copied when they are actually mutated
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 def transform_data(df: pd.DataFrame, load_id: str) -> pd.DataFrame:
     """Transform and clean the data"""
     logger.info("Starting data transformation")
     
-    # Create a copy to avoid modifying original
-    transformed_df = df.copy()
-    
     # Standardize column names
     column_mapping = {
         'Province/territory': 'province_name',
@@ -29,27 +31,38 @@ def transform_data(df: pd.DataFrame, load_id: str) -> pd.DataFrame:
         'Unit of measurement': 'unit_of_measurement',
         'Indicator result': 'indicator_result'
     }
-    transformed_df = transformed_df.rename(columns=column_mapping)
+    # rename returns a new frame, so the original is never modified
+    transformed_df = df.rename(columns=column_mapping)
     
-    # Clean and standardize data types
+    # Clean and standardize data types (results stay float64 so they round
+    # into DECIMAL(10,2) exactly as the source values do)
     transformed_df['data_year'] = pd.to_numeric(transformed_df['data_year'], errors='coerce')
     transformed_df['indicator_result'] = pd.to_numeric(transformed_df['indicator_result'], errors='coerce')
     
     # Handle missing values and data quality flags
-    transformed_df['data_quality_flag'] = 'good'
-    transformed_df.loc[transformed_df['indicator_result'].isna(), 'data_quality_flag'] = 'n/a'
+    # Two-valued flag stored as a category (int8 codes) with both values always declared
+    missing_result = transformed_df['indicator_result'].isna().to_numpy()
+    transformed_df['data_quality_flag'] = pd.Categorical(
+        np.where(missing_result, 'n/a', 'good'), categories=['good', 'n/a']
+    )
     
-    # Clean text fields
-    text_columns = ['province_name', 'procedure_name', 'metric_name', 'reporting_level']
-    for col in text_columns:
-        if col in transformed_df.columns:
-            transformed_df[col] = transformed_df[col].astype(str).str.strip()
-    
-    # Filter out invalid years
-    transformed_df = transformed_df[
-        (transformed_df['data_year'] >= 2008) & 
-        (transformed_df['data_year'] <= 2023)
+    # Clean text fields (Arrow-backed strings strip in C on contiguous buffers),
+    # then store as category since each has only a handful of distinct values
+    text_columns = [
+        col for col in ['province_name', 'procedure_name', 'metric_name', 'reporting_level']
+        if col in transformed_df.columns
     ]
+    transformed_df[text_columns] = (
+        transformed_df[text_columns]
+        .astype('string[pyarrow]')
+        .apply(lambda s: s.str.strip().astype('category'))
+    )
+    
+    # Filter out invalid (missing, out-of-range or fractional) years on the float
+    # values, then narrow the surviving years to Int16
+    years = transformed_df['data_year']
+    transformed_df = transformed_df[years.between(2008, 2023) & (years % 1 == 0)]
+    transformed_df['data_year'] = transformed_df['data_year'].astype('Int16')
     
     # Add processing metadata
     transformed_df['load_id'] = load_id
@@ -60,7 +73,8 @@ def transform_data(df: pd.DataFrame, load_id: str) -> pd.DataFrame:
 
 def clean_data_types(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and convert data types"""
-    df_clean = df.copy()
+    # Shallow copy: under Copy-on-Write only the replaced columns are new
+    df_clean = df.copy(deep=False)
     
     # Convert numeric columns
     numeric_columns = ['data_year', 'indicator_result']
@@ -81,13 +95,15 @@ def validate_transformed_data(df: pd.DataFrame) -> bool:
     # Check for required columns after transformation
     required_columns = ['province_name', 'procedure_name', 'metric_name', 'data_year']
     
-    for col in required_columns:
-        if col not in df.columns:
-            logger.error(f"Missing transformed column: {col}")
-            return False
+    columns = frozenset(df.columns)
+    missing_columns = [col for col in required_columns if col not in columns]
+    if missing_columns:
+        logger.error(f"Missing transformed columns: {missing_columns}")
+        return False
     
-    # Check data ranges
-    if df['data_year'].min() < 2008 or df['data_year'].max() > 2023:
+    # Check data ranges in a single pass over the year column
+    years = df['data_year'].to_numpy(dtype='float64', na_value=np.nan)
+    if ((years < 2008) | (years > 2023)).any():
         logger.warning("Data year outside expected range")
     
     logger.info("Transformed data validation passed")
@@ -5,21 +5,29 @@ Common utility functions and helpers
 
 from .helpers import (
     clean_column_names,
+    read_sheet,
+    optimize_dtypes,
     safe_numeric_conversion,
     calculate_percentage_change,
     format_number,
+    describe_trends,
     get_trend_description
 )
 from .data_validation import DataValidator
 from .logging_config import setup_logging, get_logger
+from .cache import ttl_cached
 
 __all__ = [
     'clean_column_names',
+    'read_sheet',
+    'optimize_dtypes',
     'safe_numeric_conversion',
     'calculate_percentage_change',
     'format_number',
+    'describe_trends',
     'get_trend_description',
     'DataValidator',
     'setup_logging',
-    'get_logger'
+    'get_logger',
+    'ttl_cached'
 ]
\ No newline at end of file
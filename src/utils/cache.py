@@ -0,0 +1,46 @@
+"""
+In-Process Caching Utilities
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+def ttl_cached(ttl: float = 300, maxsize: int = 64):
+    """Cache function results in memory for ``ttl`` seconds, LRU-bounded to ``maxsize`` entries"""
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > now:
+                    cache.move_to_end(key)
+                    return entry[1]
+                    
+            # Exceptions propagate and are never cached
+            value = func(*args, **kwargs)
+            
+            with lock:
+                cache[key] = (now + ttl, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    
+            return value
+            
+        def cache_clear():
+            """Drop all cached results"""
+            with lock:
+                cache.clear()
+                
+        wrapper.cache_clear = cache_clear
+        return wrapper
+        
+    return decorator
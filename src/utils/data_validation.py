@@ -4,22 +4,29 @@ Data Validation Utilities
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any
+import os
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any
 import logging
+from .helpers import read_sheet
 
 logger = logging.getLogger(__name__)
 
+# Source columns expected in the Excel extract (and its Parquet copy)
+EXCEL_REQUIRED_COLUMNS = [
+    'Province/territory', 'Reporting level', 'Region',
+    'Indicator', 'Metric', 'Data year', 
+    'Unit of measurement', 'Indicator result'
+]
+
 class DataValidator:
     """Data validation utilities for healthcare wait time data"""
     
     @staticmethod
     def validate_excel_structure(df: pd.DataFrame) -> Dict[str, Any]:
         """Validate Excel file structure"""
-        required_columns = [
-            'Province/territory', 'Reporting level', 'Region',
-            'Indicator', 'Metric', 'Data year', 
-            'Unit of measurement', 'Indicator result'
-        ]
+        required_columns = EXCEL_REQUIRED_COLUMNS
         
         validation_result = {
             'is_valid': True,
@@ -36,30 +43,52 @@ class DataValidator:
         
         # Check data types and ranges
         if 'Data year' in df.columns:
-            invalid_years = df[
-                (pd.to_numeric(df['Data year'], errors='coerce') < 2008) |
-                (pd.to_numeric(df['Data year'], errors='coerce') > 2023)
-            ]
-            if len(invalid_years) > 0:
-                validation_result['warnings'].append(f"Found {len(invalid_years)} records with invalid years")
+            # Parse once and count the mask instead of materializing the bad rows
+            years = pd.to_numeric(df['Data year'], errors='coerce')
+            invalid_mask = (years < 2008) | (years > 2023)
+            n_invalid = int(invalid_mask.sum())
+            if n_invalid > 0:
+                validation_result['warnings'].append(f"Found {n_invalid} records with invalid years")
+        
+        # Build the null mask once; empty rows and completeness both reduce it
+        mask = df.notna().to_numpy()
         
         # Check for completely empty rows
-        empty_rows = df.dropna(how='all')
-        if len(empty_rows) < len(df):
-            validation_result['warnings'].append(f"Removed {len(df) - len(empty_rows)} empty rows")
+        n_non_empty = int(mask.any(axis=1).sum())
+        n_empty = len(df) - n_non_empty
+        if n_empty > 0:
+            validation_result['warnings'].append(f"Removed {n_empty} empty rows")
+        
+        total_cells = mask.size
+        filled_cells = int(mask.sum())
         
         validation_result['summary'] = {
             'total_rows': len(df),
             'total_columns': len(df.columns),
             'missing_columns': len(missing_columns),
-            'data_completeness': (df.notna().sum().sum() / (len(df) * len(df.columns))) * 100
+            'data_completeness': (filled_cells / total_cells) * 100 if total_cells else 0.0
         }
         
         return validation_result
     
     @staticmethod
-    def validate_transformed_data(df: pd.DataFrame) -> Dict[str, Any]:
-        """Validate transformed data before database load"""
+    def validate_many(file_paths: List[str], sheet_name: str = 'Wait times 2008 to 2023',
+                      skiprows: int = 2) -> Dict[str, Dict[str, Any]]:
+        """Read and validate several Excel files in parallel, keyed by file path"""
+        if not file_paths:
+            return {}
+        
+        # Each file is parsed and validated independently in a worker process
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        jobs = [(path, sheet_name, skiprows) for path in file_paths]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_validate_excel_file, jobs))
+        
+        return dict(zip(file_paths, results))
+    
+    @staticmethod
+    def validate_parquet_structure(path: str) -> Dict[str, Any]:
+        """Validate a Parquet copy of the extract without loading the whole file"""
         validation_result = {
             'is_valid': True,
             'errors': [],
@@ -67,70 +96,158 @@ class DataValidator:
             'summary': {}
         }
         
-        required_columns = ['province_name', 'procedure_name', 'metric_name', 'data_year']
+        parquet_file = pq.ParquetFile(path)
+        metadata = parquet_file.metadata
+        # Skip the index column pandas stores alongside the data
+        columns = [name for name in parquet_file.schema_arrow.names
+                   if not name.startswith('__index_level_')]
         
-        # Check required columns after transformation
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        column_set = frozenset(columns)
+        missing_columns = [col for col in EXCEL_REQUIRED_COLUMNS if col not in column_set]
         if missing_columns:
             validation_result['is_valid'] = False
-            validation_result['errors'].append(f"Missing transformed columns: {missing_columns}")
-        
-        # Validate data year
-        if 'data_year' in df.columns:
-            invalid_years = df[
-                (df['data_year'] < 2008) | (df['data_year'] > 2023) | df['data_year'].isna()
-            ]
-            if len(invalid_years) > 0:
-                validation_result['warnings'].append(f"Found {len(invalid_years)} records with invalid data years")
-        
-        # Validate numeric results
-        if 'indicator_result' in df.columns:
-            negative_results = df[df['indicator_result'] < 0]
-            if len(negative_results) > 0:
-                validation_result['warnings'].append(f"Found {len(negative_results)} records with negative results")
+            validation_result['errors'].append(f"Missing required columns: {missing_columns}")
         
+        # Only the year column is read; it is coerced the same way as in validate_excel_structure
+        if 'Data year' in column_set:
+            year_column = pq.read_table(path, columns=['Data year']).column(0).to_pandas()
+            years = pd.to_numeric(year_column, errors='coerce')
+            n_invalid = int(((years < 2008) | (years > 2023)).sum())
+            if n_invalid > 0:
+                validation_result['warnings'].append(f"Found {n_invalid} records with invalid years")
+        
+        # Null counts come from row-group statistics when the writer recorded them
+        null_cells = _parquet_null_count(metadata, column_set)
+        if null_cells is None:
+            table = pq.read_table(path, columns=columns)
+            null_cells = sum(table.column(col).null_count for col in columns)
+        
+        total_cells = metadata.num_rows * len(columns)
         validation_result['summary'] = {
-            'total_records': len(df),
-            'valid_records': len(df.dropna(subset=required_columns)),
-            'data_years_range': f"{df['data_year'].min():.0f}-{df['data_year'].max():.0f}" if 'data_year' in df.columns else 'N/A',
-            'unique_provinces': df['province_name'].nunique() if 'province_name' in df.columns else 0,
-            'unique_procedures': df['procedure_name'].nunique() if 'procedure_name' in df.columns else 0
+            'total_rows': metadata.num_rows,
+            'total_columns': len(columns),
+            'missing_columns': len(missing_columns),
+            'data_completeness': ((total_cells - null_cells) / total_cells) * 100 if total_cells else 0.0
         }
         
         return validation_result
     
+    @staticmethod
+    def validate_transformed_data(df: pd.DataFrame) -> Dict[str, Any]:
+        """Validate transformed data before database load"""
+        return _transformed_result(df, _distinct_key_values(df))
+    
     @staticmethod
     def validate_database_mappings(df: pd.DataFrame, mappings: Dict[str, Dict]) -> Dict[str, Any]:
         """Validate that data can be mapped to database dimensions"""
-        validation_result = {
-            'is_valid': True,
-            'errors': [],
-            'warnings': [],
-            'mapping_stats': {}
-        }
+        return _mapping_result(_distinct_key_values(df), mappings)
+
+def _parquet_null_count(metadata, columns) -> Optional[int]:
+    """Total nulls in ``columns`` from row-group statistics, None if any are missing"""
+    null_cells = 0
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        for i in range(row_group.num_columns):
+            chunk = row_group.column(i)
+            if chunk.path_in_schema not in columns:
+                continue
+            stats = chunk.statistics
+            if stats is None or not stats.has_null_count:
+                return None
+            null_cells += stats.null_count
+    return null_cells
+
+def _validate_excel_file(job: Tuple[str, str, int]) -> Dict[str, Any]:
+    """Worker for validate_many: read one workbook sheet and validate its structure"""
+    file_path, sheet_name, skiprows = job
+    df = read_sheet(file_path, sheet_name=sheet_name, skiprows=skiprows)
+    df.columns = df.columns.str.strip()
+    return DataValidator.validate_excel_structure(df)
+
+# Transformed columns checked against dimension tables, with their mapping keys
+KEY_DIMENSIONS = [('province_name', 'provinces'), ('procedure_name', 'procedures')]
+
+def _distinct_key_values(df: pd.DataFrame) -> Dict[str, pd.Index]:
+    """Distinct values (including missing) of each key column, one scan per column"""
+    return {
+        column: pd.Index(df[column].unique())
+        for column, _ in KEY_DIMENSIONS if column in df.columns
+    }
+
+def _transformed_result(df: pd.DataFrame, distinct: Dict[str, pd.Index]) -> Dict[str, Any]:
+    """Transformed-data checks; unique counts come from the precomputed distinct values"""
+    validation_result = {
+        'is_valid': True,
+        'errors': [],
+        'warnings': [],
+        'summary': {}
+    }
+    
+    required_columns = ['province_name', 'procedure_name', 'metric_name', 'data_year']
+    
+    # Check required columns after transformation
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    if missing_columns:
+        validation_result['is_valid'] = False
+        validation_result['errors'].append(f"Missing transformed columns: {missing_columns}")
+    
+    # Single pass per column: each is pulled into numpy once and every
+    # count and bound below is derived from that array
+    years = None
+    if 'data_year' in df.columns:
+        years = df['data_year'].to_numpy(dtype='float64', na_value=np.nan)
+        n_invalid_years = int(((years < 2008) | (years > 2023) | np.isnan(years)).sum())
+        if n_invalid_years > 0:
+            validation_result['warnings'].append(f"Found {n_invalid_years} records with invalid data years")
+    
+    # Validate numeric results
+    if 'indicator_result' in df.columns:
+        results = df['indicator_result'].to_numpy(dtype='float64', na_value=np.nan)
+        n_negative = int((results < 0).sum())
+        if n_negative > 0:
+            validation_result['warnings'].append(f"Found {n_negative} records with negative results")
+    
+    present_columns = [col for col in required_columns if col in df.columns]
+    complete_rows = df[present_columns].notna().to_numpy().all(axis=1)
+    
+    if years is not None and not np.isnan(years).all():
+        years_range = f"{np.nanmin(years):.0f}-{np.nanmax(years):.0f}"
+    else:
+        years_range = 'N/A'
+    
+    validation_result['summary'] = {
+        'total_records': len(df),
+        'valid_records': int(complete_rows.sum()),
+        'data_years_range': years_range,
+        'unique_provinces': int(distinct['province_name'].notna().sum()) if 'province_name' in distinct else 0,
+        'unique_procedures': int(distinct['procedure_name'].notna().sum()) if 'procedure_name' in distinct else 0
+    }
+    
+    return validation_result
+
+def _mapping_result(distinct: Dict[str, pd.Index], mappings: Dict[str, Dict]) -> Dict[str, Any]:
+    """Mapping checks over distinct values only, not every row"""
+    validation_result = {
+        'is_valid': True,
+        'errors': [],
+        'warnings': [],
+        'mapping_stats': {}
+    }
+    
+    for column, dimension in KEY_DIMENSIONS:
+        if column not in distinct:
+            continue
+        
+        values = distinct[column]
+        mapped_mask = values.isin(list(mappings[dimension]))
+        unmapped = values[~mapped_mask]
+        if len(unmapped) > 0:
+            validation_result['warnings'].append(f"Unmapped {dimension}: {list(unmapped)}")
         
-        # Check province mappings
-        if 'province_name' in df.columns:
-            unmapped_provinces = df[~df['province_name'].isin(mappings['provinces'].keys())]['province_name'].unique()
-            if len(unmapped_provinces) > 0:
-                validation_result['warnings'].append(f"Unmapped provinces: {list(unmapped_provinces)}")
-            
-            validation_result['mapping_stats']['provinces'] = {
-                'total_unique': df['province_name'].nunique(),
-                'mapped': df[df['province_name'].isin(mappings['provinces'].keys())]['province_name'].nunique(),
-                'unmapped': len(unmapped_provinces)
-            }
-        
-        # Check procedure mappings
-        if 'procedure_name' in df.columns:
-            unmapped_procedures = df[~df['procedure_name'].isin(mappings['procedures'].keys())]['procedure_name'].unique()
-            if len(unmapped_procedures) > 0:
-                validation_result['warnings'].append(f"Unmapped procedures: {list(unmapped_procedures)}")
-            
-            validation_result['mapping_stats']['procedures'] = {
-                'total_unique': df['procedure_name'].nunique(),
-                'mapped': df[df['procedure_name'].isin(mappings['procedures'].keys())]['procedure_name'].nunique(),
-                'unmapped': len(unmapped_procedures)
-            }
-        
-        return validation_result
\ No newline at end of file
+        validation_result['mapping_stats'][dimension] = {
+            'total_unique': int(values.notna().sum()),
+            'mapped': int(mapped_mask.sum()),
+            'unmapped': len(unmapped)
+        }
+    
+    return validation_result
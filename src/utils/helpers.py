@@ -2,6 +2,7 @@
 General Utility Functions
 """
 
+import string
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional
@@ -9,14 +10,52 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Lowercase + space-to-underscore in a single translate pass
+_LOWER_UNDERSCORE = str.maketrans({' ': '_', **{c: c.lower() for c in string.ascii_uppercase}})
+
 def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and standardize column names"""
-    df = df.copy()
-    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-    return df
+    cleaned = [str(name).strip().translate(_LOWER_UNDERSCORE) for name in df.columns]
+    # rename is a lazy copy under Copy-on-Write, so no frame duplication
+    return df.rename(columns=dict(zip(df.columns, cleaned)))
+
+# Stream cells instead of building the full cell/style object graph
+OPENPYXL_STREAMING_KWARGS = {'read_only': True, 'data_only': True, 'keep_links': False}
+
+def read_sheet(file_path: str, sheet_name: str = 'Wait times 2008 to 2023',
+               skiprows: int = 2) -> pd.DataFrame:
+    """Read a worksheet with openpyxl in streaming (read-only) mode"""
+    return pd.read_excel(
+        file_path,
+        sheet_name=sheet_name,
+        skiprows=skiprows,  # Skip header rows
+        engine='openpyxl',
+        engine_kwargs=OPENPYXL_STREAMING_KWARGS
+    )
+
+def optimize_dtypes(df: pd.DataFrame,
+                    cat_cols=('province_name', 'procedure_name', 'metric_name', 'indicator')) -> pd.DataFrame:
+    """Store repeated low-cardinality text columns as category for cheaper groupbys"""
+    # astype returns a new frame (lazily copied under Copy-on-Write); the caller's is untouched
+    return df.astype({col: 'category' for col in cat_cols if col in df.columns})
 
 def safe_numeric_conversion(value, default=None):
     """Safely convert value to numeric"""
+    # Already numeric - nothing to convert
+    if isinstance(value, (int, float, np.number)):
+        return value
+    
+    # Array-likes: coerce in one vectorized pass instead of per-element calls;
+    # missing values are only filled when a default is given
+    if isinstance(value, (pd.Series, np.ndarray, list)):
+        result = pd.to_numeric(value, errors='coerce')
+        if default is None:
+            return result
+        if isinstance(result, pd.Series):
+            return result.fillna(default)
+        return np.where(np.isnan(result), default, result)
+    
+    # Other scalars (numeric strings stay int64 when integral)
     try:
         return pd.to_numeric(value)
     except (ValueError, TypeError):
@@ -29,45 +68,78 @@ def calculate_percentage_change(old_value, new_value):
     return ((new_value - old_value) / old_value) * 100
 
 def format_number(value, decimal_places=1):
-    """Format number with specified decimal places"""
+    """Format number with specified decimal places (element-wise for Series/arrays)"""
+    if isinstance(value, (pd.Series, np.ndarray)):
+        arr = np.asarray(value, dtype=float)
+        mask = np.isnan(arr)
+        formatted = np.char.mod(f'%.{decimal_places}f', np.where(mask, 0.0, arr))
+        # np.where widens the string dtype so 'N/A' is never truncated
+        formatted = np.where(mask, 'N/A', formatted)
+        if isinstance(value, pd.Series):
+            return pd.Series(formatted, index=value.index, name=value.name)
+        return formatted
+    
     if pd.isna(value):
         return 'N/A'
     return f"{value:.{decimal_places}f}"
 
+# Trend descriptions shared by the scalar and vectorized classifiers
+_TREND = (
+    "No clear trend",
+    "Stable",
+    "Slightly increasing",
+    "Increasing",
+    "Slightly decreasing",
+    "Decreasing"
+)
+
+def describe_trends(slopes: np.ndarray, r_squared: np.ndarray) -> np.ndarray:
+    """Get human-readable trend descriptions for arrays of slopes and R² values"""
+    slopes = np.asarray(slopes, dtype=float)
+    r_squared = np.asarray(r_squared, dtype=float)
+    strong = r_squared > 0.6
+    
+    conditions = [
+        r_squared < 0.3,
+        np.abs(slopes) < 0.5,
+        (slopes > 0) & strong,
+        slopes > 0,
+        strong
+    ]
+    choices = [_TREND[0], _TREND[1], _TREND[3], _TREND[2], _TREND[5]]
+    return np.select(conditions, choices, default=_TREND[4])
+
 def get_trend_description(slope, r_squared):
     """Get human-readable trend description"""
+    # Plain comparisons: no array round trip for a single pair of floats
     if r_squared < 0.3:
-        return "No clear trend"
-    elif abs(slope) < 0.5:
-        return "Stable"
-    elif slope > 0:
-        return "Increasing" if r_squared > 0.6 else "Slightly increasing"
-    else:
-        return "Decreasing" if r_squared > 0.6 else "Slightly decreasing"
+        return _TREND[0]
+    if abs(slope) < 0.5:
+        return _TREND[1]
+    strong = r_squared > 0.6
+    if slope > 0:
+        return _TREND[3 if strong else 2]
+    return _TREND[5 if strong else 4]
 
 def validate_data_completeness(df: pd.DataFrame, required_columns: List[str]) -> Dict[str, Any]:
     """Validate data completeness"""
-    validation_results = {
-        'is_valid': True,
-        'missing_columns': [],
-        'empty_columns': [],
-        'completeness_scores': {}
-    }
-    
-    # Check for missing columns
-    missing_cols = [col for col in required_columns if col not in df.columns]
-    if missing_cols:
-        validation_results['is_valid'] = False
-        validation_results['missing_columns'] = missing_cols
+    # Plain hash lookups against a frozenset; keep required_columns order
+    columns = frozenset(df.columns)
+    present = [col for col in required_columns if col in columns]
+    missing_cols = [col for col in required_columns if col not in columns]
     
-    # Check completeness for existing columns
-    for col in required_columns:
-        if col in df.columns:
-            completeness = (df[col].notna().sum() / len(df)) * 100
-            validation_results['completeness_scores'][col] = completeness
-            
-            if completeness == 0:
-                validation_results['empty_columns'].append(col)
-                validation_results['is_valid'] = False
+    # Single vectorized null-mask reduction across all present columns
+    n = len(df)
+    if n:
+        counts = df[present].notna().sum(axis=0)
+        completeness = (counts / n * 100).to_dict()
+    else:
+        completeness = {col: 0.0 for col in present}
+    empty_cols = [col for col, score in completeness.items() if score == 0]
     
-    return validation_results
\ No newline at end of file
+    return {
+        'is_valid': not missing_cols and not empty_cols,
+        'missing_columns': missing_cols,
+        'empty_columns': empty_cols,
+        'completeness_scores': completeness
+    }
\ No newline at end of file
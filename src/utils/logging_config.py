@@ -2,24 +2,60 @@
 Logging Configuration Utilities
 """
 
+import atexit
+import functools
+import logging
 import logging.config
+import logging.handlers
 import os
 from pathlib import Path
 
+# Background listener draining the log queue into the rotating log file
+_queue_listener = None
+
+def _start_queue_listener(log_queue, file_config, log_format):
+    """Start the background thread that writes queued records to disk"""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        return
+    
+    file_handler = logging.handlers.RotatingFileHandler(
+        file_config['filename'],
+        maxBytes=file_config['max_bytes'],
+        backupCount=file_config['backup_count']
+    )
+    file_handler.setLevel(file_config['level'])
+    file_handler.setFormatter(logging.Formatter(log_format))
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
+    # Flush pending records on interpreter shutdown
+    atexit.register(_queue_listener.stop)
+
 def setup_logging():
     """Setup application logging"""
     # Import here to avoid circular dependency
-    from ..config.settings import LOGGING_CONFIG, LOGS_DIR
+    from ..config.settings import LOGGING_CONFIG, LOGS_DIR, LOG_QUEUE, LOG_FILE_CONFIG
     
     # Ensure logs directory exists
     LOGS_DIR.mkdir(exist_ok=True)
     
     # Configure logging
     logging.config.dictConfig(LOGGING_CONFIG)
+    _start_queue_listener(
+        LOG_QUEUE,
+        LOG_FILE_CONFIG,
+        LOGGING_CONFIG['formatters']['standard']['format']
+    )
     
     logger = logging.getLogger(__name__)
     logger.info("Logging configured successfully")
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name):
-    """Get logger with specified name"""
+    """Get logger with specified name (cached; loggers are process-wide singletons)"""
     return logging.getLogger(name)
\ No newline at end of file
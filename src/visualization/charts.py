@@ -5,12 +5,70 @@ Description: Chart creation utilities split from dashboard
 
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
+import functools
+import hashlib
 import logging
+import threading
+from collections import Counter, OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# House chart styling, registered once at import; layered over plotly_white and
+# made the default so every px/go figure picks it up without per-figure updates
+CHART_TEMPLATE = 'wtd_default'
+pio.templates[CHART_TEMPLATE] = go.layout.Template(layout=dict(
+    title=dict(font=dict(size=16)),
+    font=dict(size=12),
+    margin=dict(l=50, r=50, t=50, b=50)
+))
+pio.templates.default = f'plotly_white+{CHART_TEMPLATE}'
+
+# Built figures kept by cached_figure, per decorated chart function
+FIGURE_CACHE_SIZE = 32
+
+def _figure_key(df: pd.DataFrame, *args, **kwargs):
+    """Order-sensitive content fingerprint of the chart data plus the remaining arguments"""
+    # Digest of the row hashes in order: reordered rows (which change category
+    # order in e.g. px.box) give a different key
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    return (digest, tuple(df.columns), args, tuple(sorted(kwargs.items())))
+
+def cached_figure(func):
+    """Reuse a built figure while the input data is unchanged (LRU-bounded)"""
+    cache = OrderedDict()
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _figure_key(*args, **kwargs)
+        with lock:
+            fig = cache.get(key)
+            if fig is not None:
+                cache.move_to_end(key)
+        
+        if fig is None:
+            fig = func(*args, **kwargs)
+            with lock:
+                cache[key] = fig
+                while len(cache) > FIGURE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        
+        # Hand out a copy so callers restyling the figure don't alter the cached one
+        return go.Figure(fig)
+    
+    def cache_clear():
+        """Drop all cached figures"""
+        with lock:
+            cache.clear()
+    
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+@cached_figure
 def create_wait_time_distribution_chart(df: pd.DataFrame, title: str = "Wait Time Distribution by Procedure") -> go.Figure:
     """Create box plot showing wait time distribution"""
     fig = px.box(
@@ -23,13 +81,19 @@ def create_wait_time_distribution_chart(df: pd.DataFrame, title: str = "Wait Tim
     fig.update_xaxis(tickangle=45)
     return fig
 
+@cached_figure
 def create_provincial_heatmap(df: pd.DataFrame, title: str = "Average Wait Times by Province and Procedure") -> go.Figure:
     """Create heatmap comparing provinces and procedures"""
-    pivot_data = df.pivot_table(
-        values='wait_time_value', 
-        index='province_name', 
-        columns='procedure_name', 
-        aggfunc='mean'
+    # Group on category codes rather than hashing strings; categories are
+    # sorted, and dropping all-NaN rows/columns keeps pivot_table's axes
+    keys = ['province_name', 'procedure_name']
+    heat_df = df[keys + ['wait_time_value']].astype({col: 'category' for col in keys})
+    pivot_data = (
+        heat_df.groupby(keys, observed=True)['wait_time_value']
+        .mean()
+        .unstack()
+        .dropna(how='all')
+        .dropna(axis=1, how='all')
     )
     
     fig = px.imshow(
@@ -40,9 +104,16 @@ def create_provincial_heatmap(df: pd.DataFrame, title: str = "Average Wait Times
     )
     return fig
 
+@cached_figure
 def create_trend_line_chart(df: pd.DataFrame, title: str = "Wait Time Trends") -> go.Figure:
     """Create line chart showing trends over time"""
-    trend_data = df.groupby(['data_year', 'procedure_name'])['wait_time_value'].mean().reset_index()
+    # Aggregate only the needed columns; as_index=False skips the reset_index copy
+    # and observed=True avoids empty groups when procedure_name is categorical
+    trend_data = (
+        df[['data_year', 'procedure_name', 'wait_time_value']]
+        .groupby(['data_year', 'procedure_name'], observed=True, as_index=False)['wait_time_value']
+        .mean()
+    )
     
     fig = px.line(
         trend_data,
@@ -105,18 +176,13 @@ def create_trend_direction_pie_chart(trend_data: dict) -> go.Figure:
     if not trend_data:
         return go.Figure().add_annotation(text="No trend data available")
     
-    trend_summary = []
-    for key, trend_info in trend_data.items():
-        trend_summary.append({
-            'Trend': trend_info['trend_category']
-        })
-    
-    trend_df = pd.DataFrame(trend_summary)
-    trend_counts = trend_df['Trend'].value_counts()
+    # Count categories directly; most_common keeps value_counts' descending order
+    trend_counts = Counter(info['trend_category'] for info in trend_data.values()).most_common()
+    names, values = zip(*trend_counts)
     
     fig = px.pie(
-        values=trend_counts.values,
-        names=trend_counts.index,
+        values=list(values),
+        names=list(names),
         title="Distribution of Trend Directions"
     )
     
@@ -125,31 +191,20 @@ def create_trend_direction_pie_chart(trend_data: dict) -> go.Figure:
 def create_summary_cards_data(db_connection) -> list:
     """Create data for dashboard summary cards"""
     try:
-        query = "SELECT * FROM mv_dashboard_summary"
+        # Explicit column order lets rows come back as plain tuples; the unit
+        # default is applied in SQL
+        query = "SELECT metric, value, COALESCE(unit, '') AS unit FROM mv_dashboard_summary"
         results = db_connection.execute_query(query)
         
-        cards_data = []
-        for item in results:
-            cards_data.append({
-                'metric': item['metric'],
-                'value': item['value'],
-                'unit': item.get('unit', '')
-            })
-        
-        return cards_data
+        return [{'metric': metric, 'value': value, 'unit': unit} for metric, value, unit in results]
         
     except Exception as e:
         logger.error(f"Error creating summary cards data: {e}")
         return []
 
 def style_chart_layout(fig: go.Figure, theme: str = 'plotly_white') -> go.Figure:
-    """Apply consistent styling to charts"""
-    fig.update_layout(
-        template=theme,
-        title_font_size=16,
-        font=dict(size=12),
-        margin=dict(l=50, r=50, t=50, b=50)
-    )
+    """Apply consistent styling to charts (the house template over ``theme``)"""
+    fig.update_layout(template=f'{theme}+{CHART_TEMPLATE}')
     return fig
 
 def create_multi_metric_chart(df: pd.DataFrame, metrics: list) -> go.Figure:
@@ -160,9 +215,12 @@ def create_multi_metric_chart(df: pd.DataFrame, metrics: list) -> go.Figure:
         shared_xaxis=True
     )
     
+    # Split the frame once instead of one boolean scan per metric
+    groups = dict(iter(df.groupby('metric_name', sort=False, observed=True)))
+    
     for i, metric in enumerate(metrics, 1):
-        metric_data = df[df['metric_name'] == metric]
-        if not metric_data.empty:
+        metric_data = groups.get(metric)
+        if metric_data is not None and not metric_data.empty:
             fig.add_trace(
                 go.Scatter(
                     x=metric_data['data_year'],